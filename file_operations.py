@@ -1,23 +1,60 @@
 # file_operations.py
 
 import os
+from operator import itemgetter
+
+_sort_key = itemgetter(0, 1)
+_item = itemgetter(2)
 
 
 def get_dir_contents(path):
-    """Gets sorted list of non-hidden files and directories."""
-    items = []
+    """Gets sorted list of non-hidden files and directories.
+
+    Each item is an ``(is_dir, name, path)`` tuple.
+    """
+    decorated = []
     error_message = None
     try:
-        for item in os.listdir(path):
-            if not item.startswith("."):  # Ignore hidden files/dirs
-                full_path = os.path.join(path, item)
-                is_dir = os.path.isdir(full_path)
-                items.append({"name": item, "is_dir": is_dir, "path": full_path})
+        # scandir hands back the entry type from the directory read itself, so
+        # is_dir() needs no extra stat() call (except for symlinks, which are
+        # still resolved so that linked directories stay navigable).
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.name.startswith("."):  # Ignore hidden files/dirs
+                    is_dir = entry.is_dir()
+                    name = entry.name
+                    # Sort key is computed once per item, not per comparison
+                    decorated.append(
+                        (not is_dir, name.casefold(), (is_dir, name, entry.path))
+                    )
     except PermissionError:
         error_message = "Permission Denied"
     except FileNotFoundError:
         error_message = "File Not Found"
 
     # Sort: directories first, then files, both alphabetically
-    items.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
+    decorated.sort(key=_sort_key)
+    items = list(map(_item, decorated))
     return items, error_message
+
+
+def with_file_item(items, path):
+    """Return *items* with the file at *path* added in listing order.
+
+    Lets a caller show a file it has just created without rescanning the
+    directory.  *items* itself is returned if the file is already listed or
+    is hidden; otherwise a new list is built, leaving *items* untouched.
+    """
+    name = os.path.basename(path)
+    if name.startswith("."):
+        return items
+    key = name.casefold()
+    pos = len(items)
+    for idx, (is_dir, other_name, other_path) in enumerate(items):
+        if other_path == path:
+            return items
+        # Files follow all directories; stop at the first file sorting after it
+        if not is_dir and other_name.casefold() > key:
+            pos = idx
+            break
+    return items[:pos] + [(False, name, path)] + items[pos:]
@@ -4,6 +4,7 @@ import curses
 import json
 import os
 import platform  # To detect OS
+from enum import IntEnum
 
 # --- Configuration File Path Logic ---
 APP_NAME = "prompt-gen"
@@ -11,7 +12,8 @@ APP_NAME = "prompt-gen"
 
 def get_config_dir():
     """Gets the platform-specific configuration directory for the application."""
-    if platform.system() == "Windows":
+    system_name = platform.system()
+    if system_name == "Windows":
         # APPDATA is typically C:\Users\<user>\AppData\Roaming
         app_data_dir = os.getenv("APPDATA")
         if app_data_dir:
@@ -19,7 +21,7 @@ def get_config_dir():
         else:
             # Fallback if APPDATA is not set (less common)
             return os.path.join(os.path.expanduser("~"), f".{APP_NAME}")
-    elif platform.system() == "Darwin":  # macOS
+    elif system_name == "Darwin":  # macOS
         return os.path.join(
             os.path.expanduser("~"), "Library", "Application Support", APP_NAME
         )
@@ -39,23 +41,34 @@ KEYBIND_FILE_PATH = os.path.join(CONFIG_DIR, DEFAULT_KEYBIND_FILE_NAME)
 # --- End Configuration File Path Logic ---
 
 
-# Define actions as constants for internal use
-ACTION_QUIT = "QUIT"
-ACTION_NAVIGATE_UP = "NAVIGATE_UP"
-ACTION_NAVIGATE_DOWN = "NAVIGATE_DOWN"
-ACTION_ENTER_DIRECTORY = "ENTER_DIRECTORY"
-ACTION_PARENT_DIRECTORY = "PARENT_DIRECTORY"
-ACTION_TOGGLE_SELECT = "TOGGLE_SELECT"
-ACTION_GENERATE_OUTPUT = "GENERATE_OUTPUT"
+# Define actions as small ints for internal use; the key maps hold these so
+# the TUI dispatch compares ints. The config file refers to them by name.
+class Action(IntEnum):
+    QUIT = 0
+    NAVIGATE_UP = 1
+    NAVIGATE_DOWN = 2
+    ENTER_DIRECTORY = 3
+    PARENT_DIRECTORY = 4
+    TOGGLE_SELECT = 5
+    GENERATE_OUTPUT = 6
+
+
+ACTION_QUIT = Action.QUIT
+ACTION_NAVIGATE_UP = Action.NAVIGATE_UP
+ACTION_NAVIGATE_DOWN = Action.NAVIGATE_DOWN
+ACTION_ENTER_DIRECTORY = Action.ENTER_DIRECTORY
+ACTION_PARENT_DIRECTORY = Action.PARENT_DIRECTORY
+ACTION_TOGGLE_SELECT = Action.TOGGLE_SELECT
+ACTION_GENERATE_OUTPUT = Action.GENERATE_OUTPUT
 
 DEFAULT_KEYBINDS_CONFIG = {
-    ACTION_QUIT: ["q"],
-    ACTION_NAVIGATE_UP: ["KEY_UP", "k"],
-    ACTION_NAVIGATE_DOWN: ["KEY_DOWN", "j"],
-    ACTION_ENTER_DIRECTORY: ["KEY_ENTER", "\n", "l"],
-    ACTION_PARENT_DIRECTORY: ["h"],
-    ACTION_TOGGLE_SELECT: [" "],
-    ACTION_GENERATE_OUTPUT: ["g"],
+    ACTION_QUIT.name: ["q"],
+    ACTION_NAVIGATE_UP.name: ["KEY_UP", "k"],
+    ACTION_NAVIGATE_DOWN.name: ["KEY_DOWN", "j"],
+    ACTION_ENTER_DIRECTORY.name: ["KEY_ENTER", "\n", "l"],
+    ACTION_PARENT_DIRECTORY.name: ["h"],
+    ACTION_TOGGLE_SELECT.name: [" "],
+    ACTION_GENERATE_OUTPUT.name: ["g"],
 }
 
 CURSES_KEY_MAP = {
@@ -76,19 +89,20 @@ def _populate_key_maps(config_to_use):
     ALT_KEY_ACTIONS.clear()
     LOADED_CONFIG_FOR_DISPLAY.clear()
 
-    for action, keys_list in config_to_use.items():
-        if action not in DEFAULT_KEYBINDS_CONFIG:
+    for action_name, keys_list in config_to_use.items():
+        if action_name not in DEFAULT_KEYBINDS_CONFIG:
             print(
-                f"Warning: Unknown action '{action}' in loaded keybindings. Ignoring."
+                f"Warning: Unknown action '{action_name}' in loaded keybindings. Ignoring."
             )
             continue
 
+        action = Action[action_name]
         LOADED_CONFIG_FOR_DISPLAY[action] = keys_list
 
         for key_specifier in keys_list:
             if not isinstance(key_specifier, str):
                 print(
-                    f"Warning: Invalid key specifier type '{type(key_specifier)}' for action '{action}'. Must be a string. Ignoring."
+                    f"Warning: Invalid key specifier type '{type(key_specifier)}' for action '{action_name}'. Must be a string. Ignoring."
                 )
                 continue
 
@@ -99,7 +113,7 @@ def _populate_key_maps(config_to_use):
                     ALT_KEY_ACTIONS[ord(char_after_alt)] = action
                 else:
                     print(
-                        f"Warning: Invalid ALT key specifier '{key_specifier}' for action '{action}'. Needs a character after 'ALT+'. Ignoring."
+                        f"Warning: Invalid ALT key specifier '{key_specifier}' for action '{action_name}'. Needs a character after 'ALT+'. Ignoring."
                     )
             elif key_spec_upper in CURSES_KEY_MAP:
                 KEY_ACTIONS[CURSES_KEY_MAP[key_spec_upper]] = action
@@ -107,7 +121,7 @@ def _populate_key_maps(config_to_use):
                 KEY_ACTIONS[ord(key_specifier)] = action
             else:
                 print(
-                    f"Warning: Unknown or invalid key specifier '{key_specifier}' for action '{action}'. Ignoring."
+                    f"Warning: Unknown or invalid key specifier '{key_specifier}' for action '{action_name}'. Ignoring."
                 )
 
 
@@ -117,41 +131,10 @@ def load_keybindings():  # Removed filepath argument, now uses global KEYBIND_FI
     created_default_file = False
     filepath_to_load = KEYBIND_FILE_PATH  # Use the determined config path
 
-    if os.path.exists(filepath_to_load):
-        try:
-            with open(filepath_to_load, "r", encoding="utf-8") as f:
-                loaded_config = json.load(f)
-
-            if not isinstance(loaded_config, dict):
-                print(
-                    f"Warning: '{filepath_to_load}' does not contain a valid dictionary. Using default keybindings."
-                )
-            else:
-                merged_config = DEFAULT_KEYBINDS_CONFIG.copy()
-                for action, keys in loaded_config.items():
-                    if action in merged_config:
-                        if isinstance(keys, list):
-                            merged_config[action] = keys
-                        else:
-                            print(
-                                f"Warning: Value for action '{action}' in '{filepath_to_load}' is not a list. Using default for this action."
-                            )
-                    else:
-                        print(
-                            f"Warning: Unknown action '{action}' in '{filepath_to_load}'. Ignoring."
-                        )
-                config_source = merged_config
-                print(f"Loaded keybindings from '{filepath_to_load}'.")
-
-        except json.JSONDecodeError:
-            print(
-                f"Error: Could not decode JSON from '{filepath_to_load}'. Using default keybindings."
-            )
-        except Exception as e:
-            print(
-                f"Error loading '{filepath_to_load}': {e}. Using default keybindings."
-            )
-    else:
+    try:
+        with open(filepath_to_load, "r", encoding="utf-8") as f:
+            loaded_config = json.load(f)
+    except FileNotFoundError:
         print(
             f"Keybinding file '{filepath_to_load}' not found. Using default keybindings and creating a default file."
         )
@@ -168,6 +151,33 @@ def load_keybindings():  # Removed filepath argument, now uses global KEYBIND_FI
             print(
                 f"Could not create default keybinding file at '{filepath_to_load}': {e}"
             )
+    except json.JSONDecodeError:
+        print(
+            f"Error: Could not decode JSON from '{filepath_to_load}'. Using default keybindings."
+        )
+    except Exception as e:
+        print(f"Error loading '{filepath_to_load}': {e}. Using default keybindings.")
+    else:
+        if not isinstance(loaded_config, dict):
+            print(
+                f"Warning: '{filepath_to_load}' does not contain a valid dictionary. Using default keybindings."
+            )
+        else:
+            merged_config = DEFAULT_KEYBINDS_CONFIG.copy()
+            for action, keys in loaded_config.items():
+                if action in merged_config:
+                    if isinstance(keys, list):
+                        merged_config[action] = keys
+                    else:
+                        print(
+                            f"Warning: Value for action '{action}' in '{filepath_to_load}' is not a list. Using default for this action."
+                        )
+                else:
+                    print(
+                        f"Warning: Unknown action '{action}' in '{filepath_to_load}'. Ignoring."
+                    )
+            config_source = merged_config
+            print(f"Loaded keybindings from '{filepath_to_load}'.")
 
     _populate_key_maps(config_source)
     if created_default_file:
@@ -9,7 +9,14 @@ project overview.  This revision prints the directory tree in **depth‑first
 from __future__ import annotations
 
 import os
-from typing import List, Set
+import stat
+import sys
+import threading
+from bisect import bisect_right, insort
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+from typing import BinaryIO, Deque, Dict, List, Optional, Set, Tuple
 
 import config
 
@@ -24,243 +31,449 @@ BOILERPLATE_PROMPT = """The following is a detailed overview of a software proje
     "questions about the project, assist with debugging, suggest refactorings, "
     "or generate documentation.\n"""
 
+# Fixed section text, encoded once for the binary output stream
+_OVERVIEW_HEADER = (
+    BOILERPLATE_PROMPT
+    + "\n"
+    + "PROJECT CONTEXT OVERVIEW\n"
+    + "========================\n\n"
+).encode("utf-8")
+_ROOTS_HEADING = (
+    b"SELECTION ROOTS (items explicitly chosen to start the project scan):\n"
+)
+_NO_ROOTS = "(None – the overview will be empty.)\n".encode("utf-8")
+_EXCLUSIONS_HEADING = (
+    b"\nEXPLICIT EXCLUSIONS (items specifically excluded from the scan):\n"
+)
+_STRUCTURE_HEADING = (
+    b"\nCOMBINED PROJECT STRUCTURE (based on selections and exclusions):\n"
+)
+_EMPTY_STRUCTURE = b"(Project structure is empty.)\n"
+_CONTENTS_HEADING = b"\n\n--- File Contents ---\n"
+_NO_CONTENTS = (
+    b"\n--- File Contents ---\n" b"(No files selected for content inclusion.)\n"
+)
+_OVERVIEW_FOOTER = b"\n\n--- End of Project Overview ---\n"
+
+# Ignore rules frozen once at import – hashed membership tests in the tree walk
+_IGNORE_DIRS = frozenset(config.IGNORE_DIRS)
+_IGNORE_FILES = frozenset(config.IGNORE_FILES)
+_IGNORE_EXTS = frozenset(ext.lower() for ext in config.IGNORE_EXTENSIONS)
+
+_by_name = attrgetter("name")
+
+# O_BINARY only exists (and matters) on Windows
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Output is streamed, so batch it into large writes
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+class _Cancelled(Exception):
+    """Raised inside the walk once the caller's cancel event is set."""
+
 
 # ---------------------------------------------------------------------------
-# Helper – exclusion logic that honours explicit exclusions as well as the
-#          implicit ones from config.py
+# Helper – file extension lookup for the ignore rules
 # ---------------------------------------------------------------------------
 
 
-def _is_path_excluded_for_generation(
-    path_to_check: str,
-    current_selection_root_path: str,
-    explicit_exclusions: Set[str],
-) -> bool:
-    """Returns *True* if *path_to_check* should be skipped.  The rule is:
-
-    * If the path itself or any of its ancestors **between** it and the
-      *selection root* is explicitly excluded by the user, we skip it.
-    * The selection root itself is **never** excluded here – that check is
-      performed by the caller.  This allows us to call the helper for the root
-      without it instantly excluding itself.
+def _extension(name: str) -> str:
+    """Lower‑cased extension of a bare file *name*, as ``os.path.splitext``
+    would give it (leading dots never start an extension), without building
+    the intermediate tuple.
     """
-
-    norm_path = os.path.normpath(path_to_check)
-    norm_root = os.path.normpath(current_selection_root_path)
-
-    # Walk up from the path towards the selection root, looking for explicit
-    # exclusions on the way.  We stop once we reach the root or escape it.
-    while True:
-        if norm_path in explicit_exclusions:
-            return True
-        if norm_path == norm_root:
-            break
-        parent = os.path.dirname(norm_path)
-        if parent == norm_path or not norm_path.startswith(norm_root):
-            break  # hit the FS root or stepped outside selection root
-        norm_path = parent
-
-    return False
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].strip(".")):
+        return ""
+    return name[dot:].lower()
 
 
 # ---------------------------------------------------------------------------
-# Public API – the single function the rest of the programme uses.
+# Helper – streams the whole overview into an already open output file
 # ---------------------------------------------------------------------------
 
 
-def generate_output_from_selection(
+def _write_overview(
+    out: BinaryIO,
     selection_roots: Set[str],
     explicit_exclusions: Set[str],
-    output_filename: str = "output.txt",
-) -> str:
-    """Walk the *selection_roots* and write *output_filename*.
+    cancel: Optional[threading.Event] = None,
+) -> int:
+    """Write the overview for *selection_roots* to *out* as it is produced.
 
-    Returns a short status message suitable for the TUI status‑bar.
+    Nothing beyond a few file bodies is held in memory at once.  Returns the
+    number of files listed in the content section.  Raises _Cancelled once
+    *cancel* is set; it is checked per directory and per content file.
     """
 
-    base_run_directory = os.getcwd()
+    def _check_cancel() -> None:
+        if cancel is not None and cancel.is_set():
+            raise _Cancelled
 
-    # Parts of the eventual file ------------------------------------------------
-    structure_lines: List[str] = []  # tree listing – DFS, dirs‑first
-    content_lines: List[str] = []  # full file contents (for selected files)
+    def write(text: str) -> None:
+        out.write(text.encode("utf-8"))
+
+    base_run_directory = os.getcwd()
+    # Paths under the run directory are made relative with a prefix slice;
+    # anything else (siblings, relative input, the directory itself) goes
+    # through os.path.relpath as before
+    base_prefix = base_run_directory
+    if not base_prefix.endswith(os.sep):
+        base_prefix += os.sep
+    base_prefix_len = len(base_prefix)
+
+    def _fast_relpath(path: str) -> str:
+        if path.startswith(base_prefix):
+            return path[base_prefix_len:]
+        return os.path.relpath(path, base_run_directory)
+
+    # Normalise the user's paths once up front; everything below compares and
+    # prints these forms, so no further normpath calls are needed.
+    norm_roots = {os.path.normpath(p) for p in selection_roots}
+    norm_exclusions = {os.path.normpath(p) for p in explicit_exclusions}
+
+    # The roots are listed in the header and walked in the same order, so
+    # sort them and work out their display paths a single time.
+    sorted_roots = sorted(norm_roots)
+    root_rel = {p: _fast_relpath(p) for p in sorted_roots}
 
     # We also build these for bookkeeping / de‑duplication ----------------------
-    paths_in_structure: Set[str] = set()  # absolute, normalised paths already shown
-    files_to_include: Set[str] = set()  # abs paths whose content we will embed
+    # Entries already shown, grouped by their (interned) parent directory –
+    # parent -> basenames, so the prefix is stored once per directory
+    paths_in_structure: Dict[str, Set[str]] = {}
+
+    def _shown_in(parent: str) -> Set[str]:
+        try:
+            return paths_in_structure[parent]
+        except KeyError:
+            shown = paths_in_structure[sys.intern(parent)] = set()
+            return shown
+
+    # abs paths whose content we will embed -> DirEntry from the walk (or *None*
+    # for files selected directly), so the size can come from its cached stat
+    files_to_include: Dict[str, Optional[os.DirEntry]] = {}
+
+    # stat() results for paths outside the walk (the selection roots); *None*
+    # records a path that could not be stat'ed so it is not retried
+    meta_cache: Dict[str, Optional[os.stat_result]] = {}
+
+    def _stat(path: str) -> Optional[os.stat_result]:
+        try:
+            return meta_cache[path]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = os.stat(path)
+        except OSError:
+            result = None
+        meta_cache[path] = result
+        return result
 
     # ---------------------------------------------------------------------
     # 1. Header section
     # ---------------------------------------------------------------------
-    structure_lines.append(BOILERPLATE_PROMPT + "\n")
-    structure_lines.append("PROJECT CONTEXT OVERVIEW\n")
-    structure_lines.append("========================\n\n")
+    out.write(_OVERVIEW_HEADER)
 
     # -- 1.1 Selection roots ----------------------------------------------------
-    structure_lines.append(
-        "SELECTION ROOTS (items explicitly chosen to start the project scan):\n"
-    )
-    if not selection_roots:
-        structure_lines.append("(None – the overview will be empty.)\n")
-    for p_abs in sorted(selection_roots):
-        rel = os.path.relpath(os.path.normpath(p_abs), base_run_directory)
-        structure_lines.append(f"- {rel}\n")
+    out.write(_ROOTS_HEADING)
+    if not norm_roots:
+        out.write(_NO_ROOTS)
+    for p_abs in sorted_roots:
+        write(f"- {root_rel[p_abs]}\n")
 
     # -- 1.2 Explicit exclusions ------------------------------------------------
-    if explicit_exclusions:
-        structure_lines.append(
-            "\nEXPLICIT EXCLUSIONS (items specifically excluded from the scan):\n"
-        )
-        for p_abs in sorted(explicit_exclusions):
-            rel = os.path.relpath(os.path.normpath(p_abs), base_run_directory)
-            structure_lines.append(f"- {rel}\n")
+    if norm_exclusions:
+        out.write(_EXCLUSIONS_HEADING)
+        for p_abs in sorted(norm_exclusions):
+            write(f"- {_fast_relpath(p_abs)}\n")
 
     # -- 1.3 Start of combined tree --------------------------------------------
-    structure_lines.append(
-        "\nCOMBINED PROJECT STRUCTURE (based on selections and exclusions):\n"
-    )
+    out.write(_STRUCTURE_HEADING)
 
-    if not selection_roots:
-        structure_lines.append("(Project structure is empty.)\n")
+    if not norm_roots:
+        out.write(_EMPTY_STRUCTURE)
 
     # ---------------------------------------------------------------------
     # 2. Depth‑first walk per selection root
     # ---------------------------------------------------------------------
 
-    def _emit_tree(
-        current_abs: str, sel_root_abs: str, indent_level: int
-    ) -> None:  # noqa: N802 – internal helper
-        """Recursive DFS emitter – directories first, then files."""
-        nonlocal structure_lines, paths_in_structure, files_to_include
-
+    # Nothing excluded is the common case – skip the lookups entirely then
+    has_exclusions = bool(norm_exclusions)
+
+    def _list_dir(
+        dir_abs: str,
+    ) -> Optional[Tuple[List[os.DirEntry], List[os.DirEntry]]]:
+        """Return the (dirs, files) of *dir_abs* to show, each sorted by name,
+        or *None* if the directory cannot be read.
+        """
+        # Separate dirs from files and apply the ignore rules in a single pass
+        # over the directory – DirEntry answers from the type recorded by the
+        # directory read, so no per‑entry stat() is needed.  Symlinks are taken
+        # as what they are (links, neither dir nor file) and are not followed,
+        # so broken, cyclic or slow targets never stall the walk.  Only a
+        # symlink chosen directly as a selection root is resolved.
+        dir_entries: List[os.DirEntry] = []
+        file_entries: List[os.DirEntry] = []
         try:
-            entries = sorted(os.listdir(current_abs))
+            with os.scandir(dir_abs) as it:
+                for e in it:
+                    name = e.name
+                    if name.startswith("."):
+                        continue  # hidden
+                    if e.is_dir(follow_symlinks=False):
+                        if name not in _IGNORE_DIRS:
+                            dir_entries.append(e)
+                    elif e.is_file(follow_symlinks=False):
+                        if name not in _IGNORE_FILES:
+                            file_entries.append(e)
         except PermissionError:
-            return  # silently skip unreadable dirs
-
-        # Separate dirs from files and apply default ignore rules
-        dir_names = [e for e in entries if os.path.isdir(os.path.join(current_abs, e))]
-        file_names = [
-            e for e in entries if os.path.isfile(os.path.join(current_abs, e))
-        ]
-
-        # Apply hidden‑file and configured ignores to *dir_names* ----------------
-        dir_names = [
-            d
-            for d in dir_names
-            if not d.startswith(".") and d not in config.IGNORE_DIRS
-        ]
-
-        # Apply ignores to *file_names* -----------------------------------------
-        file_names = [
-            f
-            for f in file_names
-            if not f.startswith(".") and f not in config.IGNORE_FILES
-        ]
-
-        indent = "    " * indent_level
-
-        # First emit directories -------------------------------------------------
-        for idx, d in enumerate(dir_names):
-            d_abs = os.path.normpath(os.path.join(current_abs, d))
-            if _is_path_excluded_for_generation(
-                d_abs, sel_root_abs, explicit_exclusions
-            ):
-                continue
-            if d_abs not in paths_in_structure:
-                structure_lines.append(f"{indent}├── {d}/\n")
-                paths_in_structure.add(d_abs)
-            _emit_tree(d_abs, sel_root_abs, indent_level + 1)
-
-        # Then emit files --------------------------------------------------------
-        for f in file_names:
-            f_abs = os.path.normpath(os.path.join(current_abs, f))
-            if _is_path_excluded_for_generation(
-                f_abs, sel_root_abs, explicit_exclusions
-            ):
-                continue
-            if f_abs not in paths_in_structure:
-                structure_lines.append(f"{indent}├── {f}\n")
-                paths_in_structure.add(f_abs)
-            files_to_include.add(f_abs)
+            return None  # silently skip unreadable dirs
+
+        # Only the survivors are sorted, each group on its own
+        dir_entries.sort(key=_by_name)
+        file_entries.sort(key=_by_name)
+        return dir_entries, file_entries
+
+    def _emit_tree(root_abs: str) -> None:
+        """Iterative DFS emitter – directories first, then files.
+
+        An explicit stack of per‑directory frames stands in for recursion, so
+        deep trees cost no Python call frames and cannot hit the recursion
+        limit.  Exclusion is inherited top‑down: an excluded directory is
+        never descended into, so everything reached here has no excluded
+        ancestor below the selection root and only the entry itself needs
+        checking.
+        """
+        listing = _list_dir(root_abs)
+        if listing is None:
+            return
+
+        emit = write
+
+        # Each frame holds the subdirectories still to visit, the files to
+        # emit once those are done, the indent for the directory's children
+        # and the set of its children already shown.  DirEntry.path is the
+        # normalised parent plus a single component, so it is normalised too
+        # – no normpath needed.
+        stack = [(iter(listing[0]), listing[1], "    ", _shown_in(root_abs))]
+        while stack:
+            _check_cancel()
+            subdirs, files, indent, shown = stack[-1]
+
+            # Directories first – descend into the next readable one ------------
+            for d_entry in subdirs:
+                d_abs = d_entry.path
+                if has_exclusions and d_abs in norm_exclusions:
+                    continue
+                d_name = d_entry.name
+                if d_name not in shown:
+                    emit(f"{indent}├── {d_name}/\n")
+                    shown.add(d_name)
+                child = _list_dir(d_abs)
+                if child is not None:
+                    stack.append(
+                        (iter(child[0]), child[1], indent + "    ", _shown_in(d_abs))
+                    )
+                    break
+            else:
+                # ...then this directory's files ---------------------------------
+                stack.pop()
+                for f_entry in files:
+                    f_abs = f_entry.path
+                    if has_exclusions and f_abs in norm_exclusions:
+                        continue
+                    f_name = f_entry.name
+                    if f_name not in shown:
+                        emit(f"{indent}├── {f_name}\n")
+                        shown.add(f_name)
+                    files_to_include[f_abs] = f_entry
+
+    # Directory roots printed so far, as path components.  Compared
+    # component‑wise, a directory's descendants sort directly after it, and the
+    # printed roots never nest, so the only candidate parent of a new root is
+    # its immediate predecessor in this sorted list.
+    printed_dir_roots: List[List[str]] = []
 
     # Walk each selection root --------------------------------------------------
-    for root_abs in sorted(os.path.normpath(p) for p in selection_roots):
-        if root_abs in explicit_exclusions:
+    for root_abs in sorted_roots:
+        _check_cancel()
+        if root_abs in norm_exclusions:
             continue  # user explicitly deselected the root itself
 
-        is_dir = os.path.isdir(root_abs)
-        rel_root = os.path.relpath(root_abs, base_run_directory)
+        root_stat = _stat(root_abs)
+        is_dir = root_stat is not None and stat.S_ISDIR(root_stat.st_mode)
+        is_file = root_stat is not None and stat.S_ISREG(root_stat.st_mode)
+        rel_root = root_rel[root_abs]
 
         # Print the root itself (unless already covered by a parent root)
-        parent_already_printed = any(
-            parent_dir
-            for parent_dir in paths_in_structure
-            if is_dir and root_abs.startswith(parent_dir + os.sep)
-        )
+        parent_already_printed = False
+        if is_dir:
+            root_parts = root_abs.split(os.sep)
+            pos = bisect_right(printed_dir_roots, root_parts)
+            if pos:
+                candidate = printed_dir_roots[pos - 1]
+                parent_already_printed = (
+                    len(candidate) < len(root_parts)
+                    and root_parts[: len(candidate)] == candidate
+                )
         if not parent_already_printed:
-            structure_lines.append(f"{rel_root}{'/' if is_dir else ''}\n")
-            paths_in_structure.add(root_abs)
-
-        if os.path.isfile(root_abs):
-            files_to_include.add(root_abs)
+            write(f"{rel_root}{'/' if is_dir else ''}\n")
+            root_parent, root_name = os.path.split(root_abs)
+            _shown_in(root_parent).add(root_name)
+            if is_dir:
+                insort(printed_dir_roots, root_parts)
+
+        if is_file:
+            files_to_include[root_abs] = None
         elif is_dir:
-            _emit_tree(root_abs, root_abs, indent_level=1)
+            _emit_tree(root_abs)
 
     # ---------------------------------------------------------------------
     # 3. File‑content section
     # ---------------------------------------------------------------------
     if not files_to_include:
-        content_lines.append("\n--- File Contents ---\n")
-        content_lines.append("(No files selected for content inclusion.)\n")
+        out.write(_NO_CONTENTS)
     else:
-        content_lines.append("\n\n--- File Contents ---\n")
-
-        included_count = 0
-
-        for file_path in sorted(files_to_include):
-            rel = os.path.relpath(file_path, base_run_directory)
-            content_lines.append(f"\n--- File: {rel} ---\n")
-
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in config.IGNORE_EXTENSIONS:
-                # Skip silently – we already have the path in the tree
-                content_lines.append("(Skipped – ignored file type)\n")
-                content_lines.append(f"--- END OF {rel} (SKIPPED) ---\n")
-                continue
-
+        out.write(_CONTENTS_HEADING)
+
+        def _skipped_block(rel: str) -> Future:
+            """Return an already completed result for an ignored file type."""
+            # Skip silently – we already have the path in the tree
+            done: Future = Future()
+            done.set_result(
+                (
+                    f"\n--- File: {rel} ---\n"
+                    "(Skipped – ignored file type)\n"
+                    f"--- END OF {rel} (SKIPPED) ---\n"
+                ).encode("utf-8")
+            )
+            return done
+
+        def _render_file(
+            file_path: str, entry: Optional[os.DirEntry], rel: str
+        ) -> bytes:
+            """Return the encoded content block for *file_path*.  Runs on a
+            worker thread, so it only builds bytes.
+            """
+            parts = [f"\n--- File: {rel} ---\n"]
+            body = b""
             try:
-                size = os.path.getsize(file_path)
+                if entry is not None:
+                    size = entry.stat().st_size
+                else:
+                    size = _stat(file_path).st_size
                 if size > config.MAX_FILE_SIZE_BYTES:
                     mb = size / 1024**2
-                    content_lines.append(
+                    parts.append(
                         f"Content skipped: File size ({mb:.2f} MB) exceeds the configured maximum "
                         f"({config.MAX_FILE_SIZE_MB} MB).\n"
                     )
-                    content_lines.append(f"--- END OF {rel} (SKIPPED) ---\n")
-                    continue
-
-                if size == 0:
-                    content_lines.append("(This file is empty)\n")
-                    content_lines.append(f"--- END OF {rel} (EMPTY) ---\n")
-                    included_count += 1
-                    continue
-
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content_lines.append(f.read())
-                included_count += 1
+                    parts.append(f"--- END OF {rel} (SKIPPED) ---\n")
+                elif size == 0:
+                    parts.append("(This file is empty)\n")
+                    parts.append(f"--- END OF {rel} (EMPTY) ---\n")
+                else:
+                    # The size is already known, so fetch the whole file with
+                    # one read().  Valid UTF‑8 is copied to the output as is;
+                    # only files that fail validation pay for dropping the
+                    # invalid bytes (decode with "ignore" and re‑encode).
+                    fd = os.open(file_path, _READ_FLAGS)
+                    try:
+                        body = os.read(fd, size)
+                    finally:
+                        os.close(fd)
+                    if not body.isascii():
+                        try:
+                            body.decode("utf-8")
+                        except UnicodeDecodeError:
+                            body = body.decode("utf-8", "ignore").encode("utf-8")
             except (
                 Exception
             ) as exc:  # pylint: disable=broad-except – we want to continue on any error
-                content_lines.append(f"Error reading file: {exc}\n")
-            finally:
-                content_lines.append(f"\n--- END OF {rel} ---\n")
+                parts.append(f"Error reading file: {exc}\n")
+            head = "".join(parts).encode("utf-8")
+            footer = f"\n--- END OF {rel} ---\n".encode("utf-8")
+            return b"".join((head, body, footer))
+
+        # Reading is I/O bound and releases the GIL, so overlap the reads on a
+        # pool sized for I/O rather than CPU.  Blocks are written in submission
+        # (sorted) order as they complete, and at most *window* are in flight,
+        # bounding memory use.
+        workers = min(32, (os.cpu_count() or 1) * 4, len(files_to_include))
+        window = workers * 2
+        pending: Deque[Future] = deque()
+
+        def _write_next() -> None:
+            out.write(pending.popleft().result())
+
+        # The dict holds paths in walk order, already sorted within each
+        # directory, so this sort is mostly merging existing runs.
+        content_paths = list(files_to_include)
+        content_paths.sort()
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            try:
+                for file_path in content_paths:
+                    _check_cancel()
+                    # Ignored types are decided from the name alone, so they
+                    # never reach the pool
+                    entry = files_to_include[file_path]
+                    name = (
+                        entry.name if entry is not None else os.path.basename(file_path)
+                    )
+                    rel = _fast_relpath(file_path)
+                    if _extension(name) in _IGNORE_EXTS:
+                        pending.append(_skipped_block(rel))
+                    else:
+                        pending.append(ex.submit(_render_file, file_path, entry, rel))
+                    if len(pending) >= window:
+                        _write_next()
+                while pending:
+                    _check_cancel()
+                    _write_next()
+            except _Cancelled:
+                # Drop the queued reads, so leaving the pool only waits for the
+                # ones already running
+                for future in pending:
+                    future.cancel()
+                raise
+
+    out.write(_OVERVIEW_FOOTER)
+    return len(files_to_include)
+
+
+# ---------------------------------------------------------------------------
+# Public API – the single function the rest of the programme uses.
+# ---------------------------------------------------------------------------
 
-    # ---------------------------------------------------------------------
-    # 4. Write the file and return status
-    # ---------------------------------------------------------------------
-    with open(output_filename, "w", encoding="utf-8") as fh:
-        fh.write("".join(structure_lines))
-        fh.write("".join(content_lines))
-        fh.write("\n\n--- End of Project Overview ---\n")
 
-    return f"Output generated to {output_filename}. {len(files_to_include)} files' content included."
+def generate_output_from_selection(
+    selection_roots: Set[str],
+    explicit_exclusions: Set[str],
+    output_filename: str = "output.txt",
+    cancel: Optional[threading.Event] = None,
+) -> str:
+    """Walk the *selection_roots* and write *output_filename*.
+
+    Setting *cancel* from another thread stops the walk; the partly written
+    file is then removed rather than left looking complete.
+
+    Returns a short status message suitable for the TUI status‑bar.
+    """
+
+    try:
+        with open(output_filename, "wb", buffering=_OUTPUT_BUFFER_SIZE) as out:
+            file_count = _write_overview(
+                out, selection_roots, explicit_exclusions, cancel
+            )
+    except _Cancelled:
+        try:
+            os.remove(output_filename)
+        except OSError:
+            pass
+        return "Generation cancelled."
+
+    return (
+        f"Output generated to {output_filename}. {file_count} files' content included."
+    )
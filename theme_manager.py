@@ -7,6 +7,7 @@ import os
 # Keys will be element names (e.g., "header"), values will be curses.color_pair(n)
 THEME_COLOR_PAIRS = {}
 CURRENT_THEME_DATA = {}  # Stores the raw loaded theme JSON
+_DEFAULT_PAIR = None  # curses.color_pair(0), set once curses colors are initialized
 
 # Mapping of common color names to curses color constants
 # We'll try to initialize bright colors if the terminal supports them (COLORS >= 16)
@@ -19,7 +20,7 @@ COLOR_NAME_MAP = {
     "magenta": curses.COLOR_MAGENTA,
     "cyan": curses.COLOR_CYAN,
     "white": curses.COLOR_WHITE,
-    # Placeholder for bright colors, will be populated in init_colors
+    # Bright colors; init_curses_colors remaps these on 8-color terminals
     "bright_black": curses.COLOR_BLACK + 8,  # Often grey
     "bright_red": curses.COLOR_RED + 8,
     "bright_green": curses.COLOR_GREEN + 8,
@@ -31,25 +32,23 @@ COLOR_NAME_MAP = {
     "default": -1,  # For using terminal's default foreground or background
 }
 
+# Bright color names in curses color order (bright_black == COLOR_BLACK + 8, ...)
+_BRIGHT_KEYS = (
+    "bright_black",
+    "bright_red",
+    "bright_green",
+    "bright_yellow",
+    "bright_blue",
+    "bright_magenta",
+    "bright_cyan",
+    "bright_white",
+)
+
 # To keep track of allocated color pairs (fg_curses_const, bg_curses_const) -> pair_number
 _allocated_pairs_map = {}
 _next_pair_number = 1  # Color pair numbers start from 1
-
-
-def _get_curses_color(color_name_or_int, default_color=curses.COLOR_WHITE):
-    """Converts a color name or int to a curses color constant."""
-    if isinstance(color_name_or_int, int):
-        return color_name_or_int  # Assume it's already a curses.COLOR_* constant or -1
-
-    color_name = str(color_name_or_int).lower()
-
-    # Handle bright colors dynamically based on terminal capability
-    if color_name.startswith("bright_") and curses.COLORS < 16:
-        # Fallback for terminals with less than 16 colors (e.g., use normal version)
-        fallback_color_name = color_name.replace("bright_", "")
-        return COLOR_NAME_MAP.get(fallback_color_name, default_color)
-
-    return COLOR_NAME_MAP.get(color_name, default_color)
+# Theme (fg, bg) values as written in the JSON -> curses.color_pair(n) attribute
+_name_pair_cache = {}
 
 
 def _get_or_create_color_pair(fg_name, bg_name):
@@ -59,8 +58,27 @@ def _get_or_create_color_pair(fg_name, bg_name):
     """
     global _next_pair_number, _allocated_pairs_map
 
-    fg_curses = _get_curses_color(fg_name, curses.COLOR_WHITE)
-    bg_curses = _get_curses_color(bg_name, curses.COLOR_BLACK)
+    # Many elements share the same fg/bg names, so resolve each pair once
+    key = (fg_name, bg_name)
+    try:
+        cached = _name_pair_cache.get(key)
+    except TypeError:  # unhashable value in a malformed theme
+        key = None
+        cached = None
+    if cached is not None:
+        return cached
+
+    # Ints are taken as curses.COLOR_* constants (or -1); names are looked up
+    # case-insensitively.  On 8-color terminals init_curses_colors has already
+    # pointed the bright_* names at their normal counterparts.
+    if isinstance(fg_name, int):
+        fg_curses = fg_name
+    else:
+        fg_curses = COLOR_NAME_MAP.get(str(fg_name).lower(), curses.COLOR_WHITE)
+    if isinstance(bg_name, int):
+        bg_curses = bg_name
+    else:
+        bg_curses = COLOR_NAME_MAP.get(str(bg_name).lower(), curses.COLOR_BLACK)
 
     if (fg_curses, bg_curses) in _allocated_pairs_map:
         pair_number = _allocated_pairs_map[(fg_curses, bg_curses)]
@@ -78,12 +96,18 @@ def _get_or_create_color_pair(fg_name, bg_name):
             pair_number = _next_pair_number
             _next_pair_number += 1
 
-    return curses.color_pair(pair_number)
+    attr = curses.color_pair(pair_number)
+    if key is not None:
+        _name_pair_cache[key] = attr
+    return attr
 
 
 def init_curses_colors():
     """Initializes curses color system and populates bright color map if possible."""
+    global _DEFAULT_PAIR
+
     curses.start_color()
+    _DEFAULT_PAIR = curses.color_pair(0)
     # Use terminal's default background and foreground for pair 0 if -1 is used for colors
     # This allows for transparency if terminal supports it.
     try:
@@ -98,25 +122,14 @@ def init_curses_colors():
             curses.COLOR_BLACK
         )  # Fallback for bg if use_default_colors fails
 
-    if curses.COLORS >= 16:
-        # Standard ANSI bright colors are usually the base color + 8
-        COLOR_NAME_MAP["bright_black"] = curses.COLOR_BLACK + 8
-        COLOR_NAME_MAP["bright_red"] = curses.COLOR_RED + 8
-        COLOR_NAME_MAP["bright_green"] = curses.COLOR_GREEN + 8
-        COLOR_NAME_MAP["bright_yellow"] = curses.COLOR_YELLOW + 8
-        COLOR_NAME_MAP["bright_blue"] = curses.COLOR_BLUE + 8
-        COLOR_NAME_MAP["bright_magenta"] = curses.COLOR_MAGENTA + 8
-        COLOR_NAME_MAP["bright_cyan"] = curses.COLOR_CYAN + 8
-        COLOR_NAME_MAP["bright_white"] = curses.COLOR_WHITE + 8
-    else:
+    # With 16+ colors the bright entries keep their module-level base + 8 values
+    if curses.COLORS < 16:
         # For 8-color terminals, map bright colors to their normal counterparts
         print(
             f"Terminal supports {curses.COLORS} colors. Bright colors will map to normal colors."
         )
-        for i in range(8):
-            COLOR_NAME_MAP[list(COLOR_NAME_MAP.keys())[i + 8]] = (
-                i  # e.g. bright_black maps to black
-            )
+        for i, bright_name in enumerate(_BRIGHT_KEYS):
+            COLOR_NAME_MAP[bright_name] = i  # e.g. bright_black maps to black
 
 
 def load_theme(theme_filepath="default_theme.json"):
@@ -127,6 +140,7 @@ def load_theme(theme_filepath="default_theme.json"):
     THEME_COLOR_PAIRS.clear()
     CURRENT_THEME_DATA = {}
     _allocated_pairs_map = {}
+    _name_pair_cache.clear()
     _next_pair_number = 1  # Reset pair number counter
 
     # Ensure curses colors are initialized before we try to use them
@@ -192,6 +206,4 @@ def load_theme(theme_filepath="default_theme.json"):
 
 def get_pair(element_name):
     """Gets the color pair for a UI element. Falls back if element not defined."""
-    return THEME_COLOR_PAIRS.get(
-        element_name, curses.color_pair(0)
-    )  # Fallback to default pair 0
+    return THEME_COLOR_PAIRS.get(element_name, _DEFAULT_PAIR)  # Fallback to pair 0
@@ -1,74 +1,245 @@
 # tui.py
 
+import concurrent.futures
 import curses
 import os
+import threading
 
 import keybindings
 import theme_manager  # Import the new theme manager
-from file_operations import get_dir_contents
+from file_operations import get_dir_contents, with_file_item
 from output_generator import generate_output_from_selection
 
+# --- Selection state ---
+# Selection roots and explicit exclusions live in one trie of nested dicts keyed
+# by path component, e.g. {"": {"home": {"me": {"proj": {_IS_ROOT: True}}}}} for
+# the root /home/me/proj.  The marker keys are ints, so they can never clash
+# with a (str) path component.
+_IS_ROOT = 0
+_IS_EXCLUDED = 1
+
+
+def _path_parts(path):
+    """Split a normalised path into trie components ("/a/b" -> ["", "a", "b"])."""
+    parts = path.split(os.sep)
+    if len(parts) > 1 and not parts[-1]:  # the filesystem root itself, "/"
+        parts.pop()
+    return parts
+
+
+def _dir_selection(sel_trie, dir_parts):
+    """Return (trie node, effective selection) for the directory *dir_parts*.
+
+    The node is None once no marks exist below the directory.  Walking down,
+    the nearest root above a path selects it and an exclusion below that root
+    deselects it again, so the last mark seen decides.
+    """
+    node = sel_trie
+    selected = False
+    for part in dir_parts:
+        node = node.get(part)
+        if node is None:
+            break
+        if _IS_ROOT in node:
+            selected = True
+        elif _IS_EXCLUDED in node:
+            selected = False
+    return node, selected
+
 
 # --- Helper function to determine effective selection (from previous step) ---
-def is_effectively_selected(item_path, selection_roots, explicit_exclusions):
-    norm_item_path = os.path.normpath(item_path)
-    current_path_segment = norm_item_path
-    selected_ancestor_root = None
-    while True:
-        if current_path_segment in selection_roots:
-            selected_ancestor_root = current_path_segment
-            break
-        parent = os.path.dirname(current_path_segment)
-        if parent == current_path_segment:
-            break
-        current_path_segment = parent
-    if selected_ancestor_root is None:
-        return False
-    if norm_item_path == selected_ancestor_root:
-        return True
-    current_path_segment = norm_item_path
-    while current_path_segment != selected_ancestor_root:
-        if current_path_segment in explicit_exclusions:
-            return False
-        parent = os.path.dirname(current_path_segment)
-        if parent == current_path_segment:
-            return False
-        if not current_path_segment.startswith(selected_ancestor_root):
-            break
-        current_path_segment = parent
-        if not current_path_segment:
+# Takes the entry's name plus the _dir_selection() of its directory, which is
+# shared by every entry of a listing, so each entry costs one dict lookup.
+def is_effectively_selected(name, dir_node, dir_selected):
+    if dir_node is not None:
+        node = dir_node.get(name)
+        if node is not None:
+            if _IS_ROOT in node:
+                return True
+            if _IS_EXCLUDED in node:
+                return False
+    return dir_selected
+
+
+def _toggle_selection(sel_trie, parts, currently_selected):
+    """Flip the effective selection of the path *parts* in the trie.
+
+    Returns the change in the number of selection roots: +1, -1 or 0.
+    """
+    node = sel_trie
+    visited = []
+    for part in parts:
+        visited.append((node, part))
+        node = node.setdefault(part, {})
+
+    root_delta = 0
+    if currently_selected:
+        if _IS_ROOT in node:
+            del node[_IS_ROOT]
+            node.pop(_IS_EXCLUDED, None)
+            root_delta = -1
+        else:
+            node[_IS_EXCLUDED] = True
+    else:
+        if _IS_EXCLUDED in node:
+            del node[_IS_EXCLUDED]
+        else:
+            node[_IS_ROOT] = True
+            root_delta = 1
+
+    # Drop the nodes left empty, so unmarked subtrees stop the lookups early
+    for parent, part in reversed(visited):
+        if parent[part]:
             break
-    return True
+        del parent[part]
+    return root_delta
+
+
+def _trie_paths(sel_trie, mark):
+    """Return the set of paths carrying *mark* (_IS_ROOT or _IS_EXCLUDED)."""
+    found = set()
+    stack = [(sel_trie, [])]
+    while stack:
+        node, parts = stack.pop()
+        for key, child in node.items():
+            if key == mark:
+                found.add(os.sep.join(parts) or os.sep)
+            elif isinstance(key, str):
+                stack.append((child, parts + [key]))
+    return found
+
+
+def _list_window(h, start_line, instruction_line, current_selection_idx):
+    """Return (displayable_lines, display_offset) for the file list."""
+    display_offset = 0
+    # Number of lines available for items (header, error (if any), instructions, status bar)
+    displayable_lines = (
+        h - start_line - (1 if instruction_line > 0 else 0) - 1
+    )  # -1 for status bar
+    if displayable_lines < 0:
+        displayable_lines = 0
 
+    if current_selection_idx >= display_offset + displayable_lines:
+        display_offset = current_selection_idx - displayable_lines + 1
+    elif current_selection_idx < display_offset:
+        display_offset = current_selection_idx
+    return displayable_lines, display_offset
+
+
+def _current_item(items, idx):
+    """Return the item under the cursor, or None if *idx* is out of range."""
+    return items[idx] if 0 <= idx < len(items) else None
+
+
+# Selection markers; both the same width, so the name column is fixed per width
+_MARKER_SELECTED = "[*] "
+_MARKER_UNSELECTED = "[ ] "
+_MARKER_WIDTH = len(_MARKER_SELECTED)
+
+# Theme attribute for each UI element, resolved once after the theme loads
+_UI_ELEMENTS = (
+    "app_background",
+    "error_message",
+    "header",
+    "instructions",
+    "item_dir",
+    "item_default",
+    "item_file",
+    "item_selected",
+    "item_selected_dir",
+    "item_selection_marker_selected",
+    "item_selection_marker_unselected",
+    "status_bar",
+)
+PAIRS = {}
+_ROW_STYLES = {}
+
+
+def _load_pairs():
+    """Fill PAIRS and the row style table from the loaded theme."""
+    PAIRS.clear()
+    for element_name in _UI_ELEMENTS:
+        PAIRS[element_name] = theme_manager.get_pair(element_name)
+
+    # Row styles keyed by (is_dir, selected, highlighted):
+    # (item attribute, marker attribute, marker)
+    _ROW_STYLES.clear()
+    for is_dir in (False, True):
+        for selected in (False, True):
+            if selected:
+                marker = _MARKER_SELECTED
+                marker_pair = PAIRS["item_selection_marker_selected"]
+            else:
+                marker = _MARKER_UNSELECTED
+                marker_pair = PAIRS["item_selection_marker_unselected"]
+            # Themes can define specific "selected_*" pairs; the highlighted
+            # row is also reversed
+            highlighted_pair = PAIRS["item_selected_dir" if is_dir else "item_selected"]
+            _ROW_STYLES[is_dir, selected, True] = (
+                highlighted_pair | curses.A_REVERSE,
+                marker_pair | curses.A_REVERSE,
+                marker,
+            )
+            item_pair = PAIRS["item_dir" if is_dir else "item_file"]
+            _ROW_STYLES[is_dir, selected, False] = (
+                item_pair | curses.A_NORMAL,
+                marker_pair | curses.A_NORMAL,
+                marker,
+            )
 
-def display_files(
+
+# Header and instruction lines cut/padded to the screen width, keyed by
+# (text, w) – rebuilt only when the path, the keybindings or the width change
+_full_width_lines = {}
+
+
+def _full_width(text, w):
+    """Return *text* cut and padded to fill a screen row of width *w*."""
+    key = (text, w)
+    line = _full_width_lines.get(key)
+    if line is None:
+        if len(_full_width_lines) >= 64:  # one entry per visited directory
+            _full_width_lines.clear()
+        line = _full_width_lines[key] = text[: w - 1].ljust(w - 1)
+    return line
+
+
+def _draw_item_row(
     stdscr,
-    current_path,
-    items,
-    current_selection_idx,
-    selection_roots,
-    explicit_exclusions,
-    error_message=None,
+    line_num_abs,
+    name_width,
+    item,
+    is_highlighted,
+    path_is_effectively_selected,
 ):
-    h, w = stdscr.getmaxyx()
+    """Draw one file-list row: selection marker, then the styled name.
 
-    # Apply background for the whole screen (important for consistent theming)
-    # The bkgd call also clears the screen with the new background attribute
-    stdscr.bkgd(" ", theme_manager.get_pair("app_background"))
-    stdscr.erase()  # Ensure screen is cleared with new background
+    *name_width* is the screen width less the marker and the last column.
+    """
+    is_dir, display_name, _ = item
+    if is_dir:
+        display_name += "/"
+
+    item_attr, marker_attr, marker = _ROW_STYLES[
+        is_dir, path_is_effectively_selected, is_highlighted
+    ]
+
+    # Name padded out to the row width, so the item's style covers the rest of
+    # the line and overwrites whatever the row showed before
+    rest = display_name[:name_width].ljust(name_width)
 
-    # --- Header ---
-    header_pair = theme_manager.get_pair("header")
-    header_text = f"Interactive Project Lister - Path: {current_path}"
     try:
-        stdscr.addstr(
-            0, 0, header_text[: w - 1].ljust(w - 1), header_pair | curses.A_BOLD
-        )
+        if marker_attr == item_attr:
+            stdscr.addstr(line_num_abs, 0, marker + rest, item_attr)
+        else:
+            stdscr.addstr(line_num_abs, 0, marker, marker_attr)
+            stdscr.addstr(line_num_abs, _MARKER_WIDTH, rest, item_attr)
     except curses.error:
         pass  # Terminal too small
 
-    # --- Instructions ---
-    instr_pair = theme_manager.get_pair("instructions")
+
+def _build_instructions_text():
+    """Return the key-help line for the currently loaded keybindings."""
     nav_up_keys = "/".join(
         keybindings.get_display_for_action(keybindings.ACTION_NAVIGATE_UP)
     )
@@ -96,12 +267,125 @@ def display_files(
         f"[{generate_keys}] Gen",
         f"[{quit_keys}] Quit",
     ]
-    instructions_text = " | ".join(instructions_parts)
+    return " | ".join(instructions_parts)
+
+
+# How long getch() waits before the loop counts the user as idle
+_IDLE_TIMEOUT_MS = 100
+
+# Status-bar animation shown while the output is being generated
+_SPINNER = "|/-\\"
+
+
+def _dir_mtime(path):
+    """Return the st_mtime_ns of directory *path*, or None if it can't be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _prefetch_dir(prefetched, path):
+    """Thread target: list *path* ahead of an ENTER into *prefetched*."""
+    # Taken before the scan, so a change made while listing shows up as a
+    # newer mtime on ENTER
+    mtime = _dir_mtime(path)
+    prefetched[path] = (mtime, get_dir_contents(path))
+
+
+def _prefetched_listing(prefetched, path):
+    """Return the prefetched listing of *path* if it is finished and the
+    directory has not changed since, else None.
+    """
+    entry = prefetched.get(path)
+    if entry is None:
+        return None
+    mtime, listing = entry
+    if mtime is None or _dir_mtime(path) != mtime:
+        return None
+    return listing
+
+
+# Key-help line, built once in tui_main after the keybindings are loaded
+_instructions_text = ""
+
+# The file list is drawn into a pad holding a band of rows around the visible
+# window.  Moving the cursor restamps the two rows involved and scrolling blits
+# another part of the band; the band itself is only redrawn when the listing
+# or the width changes, or the window scrolls out of it.
+_PAD_MIN_ROWS = 256
+_pad = None
+_pad_items = None  # listing the pad was drawn for
+_pad_base = 0  # index of the item in the pad's first row
+_pad_highlight = -1  # index of the item drawn highlighted in the pad
+
+# What the last paint of display_files showed: (frame key, items, start_line).
+# While these hold, the header, instructions and error line are left alone.
+_last_rendered = None
+
+
+def _fill_pad(
+    items,
+    display_offset,
+    displayable_lines,
+    w,
+    current_selection_idx,
+    dir_node,
+    dir_selected,
+):
+    """(Re)create the pad with a band of rows around the visible window."""
+    global _pad, _pad_items, _pad_base, _pad_highlight
+
+    band = max(_PAD_MIN_ROWS, 3 * displayable_lines)
+    base = max(0, min(display_offset - displayable_lines, len(items) - band))
+    rows = min(band, len(items) - base)
+
+    _pad = curses.newpad(rows, w)
+    _pad.bkgd(" ", PAIRS["app_background"])
+    name_width = w - 1 - _MARKER_WIDTH
+    for row, item in enumerate(items[base : base + rows]):
+        _draw_item_row(
+            _pad,
+            row,
+            name_width,
+            item,
+            base + row == current_selection_idx,
+            is_effectively_selected(item[1], dir_node, dir_selected),
+        )
+    _pad_items = items
+    _pad_base = base
+    _pad_highlight = current_selection_idx
+
+
+def _draw_frame(stdscr, h, w, current_path, items, error_message):
+    """Clear the screen and draw everything but the file rows and status bar.
+
+    Returns the screen line the file list starts on.
+    """
     instruction_line = h - 2
+
+    # Apply background for the whole screen (important for consistent theming)
+    # The bkgd call also clears the screen with the new background attribute
+    stdscr.bkgd(" ", PAIRS["app_background"])
+    stdscr.erase()  # Ensure screen is cleared with new background
+
+    # --- Header ---
+    header_pair = PAIRS["header"]
+    header_text = f"Interactive Project Lister - Path: {current_path}"
+    try:
+        stdscr.addstr(0, 0, _full_width(header_text, w), header_pair | curses.A_BOLD)
+    except curses.error:
+        pass  # Terminal too small
+
+    # --- Instructions ---
+    instr_pair = PAIRS["instructions"]
     try:
         if instruction_line > 0:  # Ensure there's space for instructions
             stdscr.addstr(
-                instruction_line, 0, instructions_text[: w - 1].ljust(w - 1), instr_pair
+                instruction_line,
+                0,
+                _full_width(_instructions_text, w),
+                instr_pair,
             )
     except curses.error:
         pass
@@ -109,7 +393,7 @@ def display_files(
     # --- Error Message ---
     error_start_line = 1
     if error_message:
-        error_pair = theme_manager.get_pair("error_message")
+        error_pair = PAIRS["error_message"]
         try:
             stdscr.addstr(
                 error_start_line,
@@ -123,137 +407,6 @@ def display_files(
     else:
         start_line = error_start_line
 
-    # --- File/Directory Listing ---
-    display_offset = 0
-    # Number of lines available for items (header, error (if any), instructions, status bar)
-    displayable_lines = (
-        h - start_line - (1 if instruction_line > 0 else 0) - 1
-    )  # -1 for status bar
-    if displayable_lines < 0:
-        displayable_lines = 0
-
-    if current_selection_idx >= display_offset + displayable_lines:
-        display_offset = current_selection_idx - displayable_lines + 1
-    elif current_selection_idx < display_offset:
-        display_offset = current_selection_idx
-
-    for i, item in enumerate(items):
-        if i < display_offset:
-            continue
-
-        # Calculate actual line number on screen
-        line_num_abs = start_line + (i - display_offset)
-        # Ensure we don't draw over instructions or status bar
-        if line_num_abs >= instruction_line and instruction_line > 0:
-            break
-        if line_num_abs >= h - 1:
-            break  # Stop before status bar line
-
-        display_name = item["name"]
-        is_dir = item["is_dir"]
-        if is_dir:
-            display_name += "/"
-
-        path_is_effectively_selected = is_effectively_selected(
-            item["path"], selection_roots, explicit_exclusions
-        )
-
-        # Determine style based on selection and type
-        item_style = curses.A_NORMAL
-        if i == current_selection_idx:  # Highlighted item
-            if is_dir:
-                item_pair = theme_manager.get_pair("item_selected_dir")
-            else:
-                item_pair = theme_manager.get_pair("item_selected")
-            item_style = (
-                curses.A_REVERSE
-            )  # Often themes define selected bg/fg, reverse might not be needed
-            # Or, themes can define specific "selected_*" pairs
-        else:  # Not highlighted
-            if is_dir:
-                item_pair = theme_manager.get_pair("item_dir")
-            else:
-                item_pair = theme_manager.get_pair("item_file")
-
-        # Selection marker
-        if path_is_effectively_selected:
-            marker = "[*] "
-            marker_pair = theme_manager.get_pair("item_selection_marker_selected")
-        else:
-            marker = "[ ] "
-            marker_pair = theme_manager.get_pair("item_selection_marker_unselected")
-
-        line_str_name = f"{display_name}"
-
-        try:
-            # Draw selection marker
-            stdscr.addstr(line_num_abs, 0, marker, marker_pair)
-            # Draw item name
-            # Ensure enough space for the marker before drawing the name
-            stdscr.addstr(
-                line_num_abs,
-                len(marker),
-                line_str_name[: w - 1 - len(marker)],
-                item_pair | item_style,
-            )
-            # Clear rest of the line with the item's base background (if not selected) or app background
-            # This prevents visual artifacts if item_pair has a different background than app_background
-            # This is a bit tricky. If item_pair has its own bg, clearing with app_background might look odd.
-            # For now, let's assume item_pair's bg is what we want for the whole line segment.
-            # Or, if item_style is A_REVERSE, it handles the background for the selected part.
-            # A simpler approach: pad the string with spaces and let addstr handle it.
-            full_line_display = (marker + line_str_name)[: w - 1].ljust(w - 1)
-            # Re-draw with combined attributes if selected for full line effect
-            if i == current_selection_idx:
-                stdscr.addstr(
-                    line_num_abs, 0, marker, marker_pair | item_style
-                )  # Apply style to marker too
-                stdscr.addstr(
-                    line_num_abs,
-                    len(marker),
-                    line_str_name[: w - 1 - len(marker)],
-                    item_pair | item_style,
-                )
-                # Clear rest of line with selected style
-                remaining_len = (
-                    w - 1 - len(marker) - len(line_str_name[: w - 1 - len(marker)])
-                )
-                if remaining_len > 0:
-                    stdscr.addstr(" " * remaining_len, item_pair | item_style)
-
-            else:  # Not selected, draw marker and name separately
-                stdscr.addstr(line_num_abs, 0, marker, marker_pair)
-                stdscr.addstr(
-                    line_num_abs,
-                    len(marker),
-                    line_str_name[: w - 1 - len(marker)],
-                    item_pair,
-                )
-                # Clear rest of line with default item background or app background
-                default_bg_pair = (
-                    theme_manager.get_pair("item_default")
-                    if not is_dir
-                    else theme_manager.get_pair("item_dir")
-                )
-                # If item_pair has specific bg, use it, else use app_background
-                # This part is complex to get perfect without knowing theme structure well.
-                # Simplest for now: rely on stdscr.bkgd and ensure elements draw fg only if bg is "default"
-                # Or, ensure elements draw their full bg.
-                # Let's try padding with the item's pair.
-                current_text_len = len(marker) + len(
-                    line_str_name[: w - 1 - len(marker)]
-                )
-                if current_text_len < w - 1:
-                    stdscr.addstr(
-                        line_num_abs,
-                        current_text_len,
-                        " " * (w - 1 - current_text_len),
-                        item_pair,
-                    )
-
-        except curses.error:
-            pass  # Terminal too small
-
     if (
         not items
         and not error_message
@@ -264,15 +417,109 @@ def display_files(
                 start_line,
                 2,
                 "(Directory is empty or not accessible)",
-                theme_manager.get_pair("item_default"),
+                PAIRS["item_default"],
             )
         except curses.error:
             pass
 
-    # stdscr.refresh() # Refresh is called in the main loop after status bar
+    return start_line
+
+
+def display_files(
+    stdscr,
+    current_path,
+    items,
+    dir_parts,
+    current_selection_idx,
+    sel_trie,
+    error_message=None,
+):
+    """Stage the file list for the next doupdate.
+
+    Returns True if the whole screen was cleared and redrawn.
+    """
+    global _last_rendered, _pad_highlight
+
+    h, w = stdscr.getmaxyx()
+    instruction_line = h - 2
+
+    frame_key = (h, w, current_path, error_message)
+    repaint = (
+        _last_rendered is None
+        or _last_rendered[0] != frame_key
+        or _last_rendered[1] is not items
+    )
+    if not repaint:
+        # Same screen and listing as the last paint – only list rows can differ
+        start_line = _last_rendered[2]
+    else:
+        start_line = _draw_frame(stdscr, h, w, current_path, items, error_message)
+        _last_rendered = (frame_key, items, start_line)
+        # Stage the freshly cleared screen now, so the list blitted below lands
+        # on top of it
+        stdscr.noutrefresh()
+
+    # --- File/Directory Listing ---
+    displayable_lines, display_offset = _list_window(
+        h, start_line, instruction_line, current_selection_idx
+    )
+    visible = min(displayable_lines, len(items) - display_offset)
+    if visible <= 0:
+        return repaint
+    dir_node, dir_selected = _dir_selection(sel_trie, dir_parts)
+
+    if (
+        _pad is None
+        or _pad_items is not items
+        or _pad.getmaxyx()[1] != w
+        or display_offset < _pad_base
+        or display_offset + visible > _pad_base + _pad.getmaxyx()[0]
+    ):
+        _fill_pad(
+            items,
+            display_offset,
+            displayable_lines,
+            w,
+            current_selection_idx,
+            dir_node,
+            dir_selected,
+        )
+    else:
+        # Only the previously and newly highlighted rows can have changed: a
+        # toggle only affects the highlighted row's marker, since nothing else
+        # in the listing descends from it
+        name_width = w - 1 - _MARKER_WIDTH
+        for i in {_pad_highlight, current_selection_idx}:
+            row = i - _pad_base
+            if 0 <= row < _pad.getmaxyx()[0]:
+                item = items[i]
+                _draw_item_row(
+                    _pad,
+                    row,
+                    name_width,
+                    item,
+                    i == current_selection_idx,
+                    is_effectively_selected(item[1], dir_node, dir_selected),
+                )
+        _pad_highlight = current_selection_idx
+        if repaint:
+            _pad.touchwin()  # stdscr was just cleared underneath
+
+    _pad.noutrefresh(
+        display_offset - _pad_base,
+        0,
+        start_line,
+        0,
+        start_line + visible - 1,
+        w - 1,
+    )
+    # The main loop copies the status bar out (noutrefresh/doupdate) afterwards
+    return repaint
 
 
 def tui_main(stdscr, initial_path):
+    global _instructions_text
+
     # --- Initialize Curses and Theming ---
     curses.curs_set(0)  # Hide cursor
     stdscr.keypad(True)  # Enable special keys
@@ -283,65 +530,114 @@ def tui_main(stdscr, initial_path):
         print("CRITICAL: Default theme could not be loaded. Exiting.")
         return
 
+    _load_pairs()
+
     # Apply initial background for the whole screen
-    stdscr.bkgd(" ", theme_manager.get_pair("app_background"))
+    stdscr.bkgd(" ", PAIRS["app_background"])
     # --- End Initialization ---
 
     keybindings.load_keybindings()  # Load keybindings
+    _instructions_text = _build_instructions_text()
 
     current_path = os.path.abspath(initial_path)
     items, error_msg = get_dir_contents(current_path)
+    dir_parts = _path_parts(current_path)
     current_selection_idx = 0
 
-    selection_roots = set()
-    explicit_exclusions = set()
+    sel_trie = {}  # selection roots and explicit exclusions, see _IS_ROOT
+    root_count = 0  # number of _IS_ROOT marks in sel_trie
     status_message = ""
 
+    # Child directory path -> (directory mtime, get_dir_contents() result), or
+    # None while still being listed; filled in the background while the cursor
+    # rests on a directory.
+    # Replaced, not cleared, on every directory change, so a late worker can
+    # only write into a dict that is no longer used.
+    prefetched = {}
+    stdscr.timeout(_IDLE_TIMEOUT_MS)
+
+    # Only state changes (and terminal resizes) repaint; keys that map to no
+    # action leave the screen as it is.
+    dirty = True
+    last_status = None  # (h, w, text) the status bar was last drawn with
+
     while True:
-        stdscr.erase()  # Clear screen at the start of each loop iteration
-        display_files(
-            stdscr,
-            current_path,
-            items,
-            current_selection_idx,
-            selection_roots,
-            explicit_exclusions,
-            error_msg,
-        )
+        if dirty:
+            repainted = display_files(
+                stdscr,
+                current_path,
+                items,
+                dir_parts,
+                current_selection_idx,
+                sel_trie,
+                error_msg,
+            )
 
-        # --- Status Bar ---
-        status_bar_pair = theme_manager.get_pair("status_bar")
-        h, w = stdscr.getmaxyx()
-        current_status_text = (
-            status_message
-            if status_message
-            else f"Items: {len(items)} | Selected Roots: {len(selection_roots)}"
-        )
-        try:
-            if h > 1:  # Ensure there's a line for status bar
-                stdscr.addstr(
-                    h - 1, 0, current_status_text[: w - 1].ljust(w - 1), status_bar_pair
+            # --- Status Bar ---
+            status_bar_pair = PAIRS["status_bar"]
+            h, w = stdscr.getmaxyx()
+            if status_message:
+                current_status_text = status_message
+            else:
+                current_status_text = (
+                    f"Items: {len(items)} | Selected Roots: {root_count}"
                 )
-        except curses.error:
-            pass
+            # Rewrite the line only if its text or size changed, or a full
+            # repaint cleared it
+            status_key = (h, w, current_status_text)
+            if repainted or status_key != last_status:
+                try:
+                    if h > 1:  # Ensure there's a line for status bar
+                        stdscr.addstr(
+                            h - 1,
+                            0,
+                            current_status_text[: w - 1].ljust(w - 1),
+                            status_bar_pair,
+                        )
+                except curses.error:
+                    pass
+                last_status = status_key
 
-        stdscr.refresh()  # Refresh the screen once all elements are drawn
+            # Send everything drawn this frame to the terminal in one update
+            stdscr.noutrefresh()
+            curses.doupdate()
 
-        status_message = ""  # Clear status message for next iteration
-        error_msg = None  # Clear error message for next iteration
+            dirty = False
+            status_message = ""  # Clear status message for next iteration
+            error_msg = None  # Clear error message for next iteration
 
         raw_key = stdscr.getch()
         effective_action = None
 
+        if raw_key == -1:
+            # Idle – start listing the directory under the cursor, so that
+            # entering it needs no scan of its own
+            current_item = _current_item(items, current_selection_idx)
+            if current_item and current_item[0]:  # is_dir
+                idle_path = current_item[2]
+                if idle_path not in prefetched:  # one scan per directory
+                    prefetched[idle_path] = None
+                    threading.Thread(
+                        target=_prefetch_dir,
+                        args=(prefetched, idle_path),
+                        daemon=True,
+                    ).start()
+            continue
+
         if raw_key == 27:
-            stdscr.timeout(50)
+            # Terminals send Alt+key as Esc and the key in one burst, so the
+            # second byte is already buffered; peek without blocking
+            stdscr.nodelay(True)
             second_key = stdscr.getch()
-            stdscr.timeout(-1)
+            stdscr.timeout(_IDLE_TIMEOUT_MS)
             if second_key != -1:
                 effective_action = keybindings.ALT_KEY_ACTIONS.get(second_key)
         else:
             effective_action = keybindings.KEY_ACTIONS.get(raw_key)
 
+        if raw_key == curses.KEY_RESIZE:
+            dirty = True
+
         if effective_action == keybindings.ACTION_QUIT:
             break
         elif effective_action == keybindings.ACTION_NAVIGATE_UP:
@@ -349,73 +645,130 @@ def tui_main(stdscr, initial_path):
                 current_selection_idx = (current_selection_idx - 1 + len(items)) % len(
                     items
                 )
+                dirty = True
         elif effective_action == keybindings.ACTION_NAVIGATE_DOWN:
             if items:
                 current_selection_idx = (current_selection_idx + 1) % len(items)
+                dirty = True
         elif effective_action == keybindings.ACTION_ENTER_DIRECTORY:
-            if (
-                items
-                and 0 <= current_selection_idx < len(items)
-                and items[current_selection_idx]["is_dir"]
-            ):
-                new_path_candidate = items[current_selection_idx]["path"]
-                temp_items, test_err = get_dir_contents(
-                    new_path_candidate
-                )  # Store items to check if dir is accessible
+            current_item = _current_item(items, current_selection_idx)
+            if current_item and current_item[0]:  # is_dir
+                new_path_candidate = current_item[2]  # path
+                # One listing serves as both the accessibility check and the
+                # new items – taken from the prefetch if it has finished and
+                # the directory is unchanged since
+                listing = _prefetched_listing(prefetched, new_path_candidate)
+                if listing is None:
+                    listing = get_dir_contents(new_path_candidate)
+                temp_items, test_err = listing
                 if not test_err:
                     current_path = new_path_candidate
                     items = temp_items  # Use the already fetched items
+                    dir_parts = _path_parts(current_path)
                     current_selection_idx = 0
+                    prefetched = {}
                 else:
                     error_msg = test_err  # Show error if dir not accessible
+                dirty = True
             # else: error_msg = None # No error if trying to enter file
         elif effective_action == keybindings.ACTION_PARENT_DIRECTORY:
             parent_path = os.path.dirname(current_path)
             if parent_path != current_path:
                 current_path = parent_path
                 items, error_msg = get_dir_contents(current_path)
+                dir_parts = _path_parts(current_path)
                 current_selection_idx = 0
+                prefetched = {}
+                dirty = True
         elif effective_action == keybindings.ACTION_TOGGLE_SELECT:
-            if items and 0 <= current_selection_idx < len(items):
-                item_path = os.path.normpath(items[current_selection_idx]["path"])
-                currently_selected_eff = is_effectively_selected(
-                    item_path, selection_roots, explicit_exclusions
+            current_item = _current_item(items, current_selection_idx)
+            if current_item:
+                item_name = current_item[1]
+                root_count += _toggle_selection(
+                    sel_trie,
+                    dir_parts + [item_name],
+                    is_effectively_selected(
+                        item_name, *_dir_selection(sel_trie, dir_parts)
+                    ),
                 )
-                if currently_selected_eff:
-                    if item_path in selection_roots:
-                        selection_roots.remove(item_path)
-                        explicit_exclusions.discard(item_path)
-                    else:
-                        explicit_exclusions.add(item_path)
-                else:
-                    if item_path in explicit_exclusions:
-                        explicit_exclusions.remove(item_path)
-                    else:
-                        selection_roots.add(item_path)
-                        explicit_exclusions.discard(item_path)
+                dirty = True
         elif effective_action == keybindings.ACTION_GENERATE_OUTPUT:
+            selection_roots = _trie_paths(sel_trie, _IS_ROOT)
             if not selection_roots:
                 status_message = "No selection roots. Use 'Select' key to mark items."
             else:
-                generating_msg = "Generating output... please wait."
-                # Display generating message in status bar temporarily
-                try:
-                    if h > 1:
-                        stdscr.addstr(
-                            h - 1,
-                            0,
-                            generating_msg[: w - 1].ljust(w - 1),
-                            theme_manager.get_pair("status_bar") | curses.A_BOLD,
-                        )
-                    stdscr.refresh()
-                except curses.error:
-                    pass
-
                 output_filename = "output.txt"
-                status_message = generate_output_from_selection(
-                    selection_roots, explicit_exclusions, output_filename
-                )
-                items, error_msg = get_dir_contents(current_path)  # Refresh view
+                # Generate on a worker thread and animate the status bar until
+                # it finishes.  Esc, the quit key or Ctrl-C set *cancel*, which
+                # the generator checks per directory and per file; other keys
+                # are dropped.
+                cancel = threading.Event()
+                quit_requested = False
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                    generation = pool.submit(
+                        generate_output_from_selection,
+                        selection_roots,
+                        _trie_paths(sel_trie, _IS_EXCLUDED),
+                        output_filename,
+                        cancel,
+                    )
+                    spin = 0
+                    try:
+                        while not generation.done():
+                            if cancel.is_set():
+                                generating_msg = "Cancelling output generation..."
+                            else:
+                                generating_msg = (
+                                    "Generating output... please wait. "
+                                    f"{_SPINNER[spin]}  (Esc to cancel)"
+                                )
+                            spin = (spin + 1) % len(_SPINNER)
+                            h, w = stdscr.getmaxyx()
+                            try:
+                                if h > 1:
+                                    stdscr.addstr(
+                                        h - 1,
+                                        0,
+                                        generating_msg[: w - 1].ljust(w - 1),
+                                        PAIRS["status_bar"] | curses.A_BOLD,
+                                    )
+                                stdscr.noutrefresh()
+                                curses.doupdate()
+                            except curses.error:
+                                pass
+                            key = stdscr.getch()  # waits up to _IDLE_TIMEOUT_MS
+                            if key == 27:
+                                # A bare Esc, not the start of an Alt+key
+                                stdscr.nodelay(True)
+                                if stdscr.getch() == -1:
+                                    cancel.set()
+                                stdscr.timeout(_IDLE_TIMEOUT_MS)
+                            elif keybindings.KEY_ACTIONS.get(key) == (
+                                keybindings.ACTION_QUIT
+                            ):
+                                cancel.set()
+                                quit_requested = True
+                    except KeyboardInterrupt:
+                        # Stop the worker too, so leaving the pool does not
+                        # wait for the whole generation
+                        cancel.set()
+                        raise
+                    status_message = generation.result()
+                if quit_requested:
+                    break
+                last_status = None  # the spinner overwrote the status bar
+                output_path = os.path.abspath(output_filename)
+                if os.path.dirname(output_path) == current_path:
+                    if os.path.isfile(output_path):
+                        # Writing the output changes nothing else on screen, so
+                        # rather than rescanning, just list the file
+                        items = with_file_item(items, output_path)
+                    else:
+                        # Cancelled: the partial file was removed, and with it
+                        # any earlier output this listing may show
+                        items, error_msg = get_dir_contents(current_path)
+                prefetched = {}  # the output may have landed in a listed child
+            dirty = True
         elif effective_action is None and raw_key == 27:
             pass
         # else: error_msg = None # No error for unmapped keys